@@ -0,0 +1,28 @@
+"""add partial index on active plans per athlete
+
+Revision ID: 20260211_0005
+Revises: 20260211_0004
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260211_0005"
+down_revision = "20260211_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_plan_active_by_athlete",
+        "plans",
+        ["athlete_id"],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_plan_active_by_athlete", table_name="plans")
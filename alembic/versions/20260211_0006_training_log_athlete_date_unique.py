@@ -0,0 +1,60 @@
+"""add unique (athlete_id, date) constraint on training_logs
+
+Duplicate (athlete_id, date) rows are collapsed to the latest log before the
+constraint is added: the API records one training log per athlete per day.
+
+Revision ID: 20260211_0006
+Revises: 20260211_0005
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+
+
+revision = "20260211_0006"
+down_revision = "20260211_0005"
+branch_labels = None
+depends_on = None
+
+
+# Each log paired with the newest log id for its (athlete_id, date); that newest row is kept.
+_RANKED = "SELECT id, max(id) OVER (PARTITION BY athlete_id, date) AS keep_id FROM training_logs"
+
+
+def upgrade() -> None:
+    # Earlier writes were unconstrained, so collapse duplicate days to their latest log first.
+    # Reflections follow the kept log; when several rows in a group have one, the newest wins.
+    op.execute(
+        f"""
+        DELETE FROM session_reflections r
+        USING ({_RANKED}) d
+        WHERE r.training_log_id = d.id
+          AND d.id <> d.keep_id
+          AND EXISTS (
+              SELECT 1
+              FROM session_reflections o
+              JOIN ({_RANKED}) od ON od.id = o.training_log_id
+              WHERE od.keep_id = d.keep_id AND od.id > d.id
+          )
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE session_reflections r
+        SET training_log_id = d.keep_id
+        FROM ({_RANKED}) d
+        WHERE r.training_log_id = d.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM training_logs t
+        USING training_logs n
+        WHERE t.athlete_id = n.athlete_id AND t.date = n.date AND t.id < n.id
+        """
+    )
+    op.create_unique_constraint("uq_training_log_athlete_date", "training_logs", ["athlete_id", "date"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_training_log_athlete_date", "training_logs", type_="unique")
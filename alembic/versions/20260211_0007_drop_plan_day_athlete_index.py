@@ -0,0 +1,23 @@
+"""drop plan_day_sessions athlete_id index covered by uq_plan_day_session_athlete_day
+
+Revision ID: 20260211_0007
+Revises: 20260211_0006
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+
+
+revision = "20260211_0007"
+down_revision = "20260211_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The unique (athlete_id, session_day) index serves athlete and athlete/date-range lookups.
+    op.drop_index("ix_plan_day_sessions_athlete_id", table_name="plan_day_sessions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_plan_day_sessions_athlete_id", "plan_day_sessions", ["athlete_id"])
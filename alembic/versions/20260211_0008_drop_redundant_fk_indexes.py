@@ -0,0 +1,25 @@
+"""drop single-column indexes covered by unique constraints
+
+Revision ID: 20260211_0008
+Revises: 20260211_0007
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+
+
+revision = "20260211_0008"
+down_revision = "20260211_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # uq_checkin_athlete_day and uq_plan_week lead with these columns.
+    op.drop_index("ix_checkins_athlete_id", table_name="checkins")
+    op.drop_index("ix_plan_weeks_plan_id", table_name="plan_weeks")
+
+
+def downgrade() -> None:
+    op.create_index("ix_plan_weeks_plan_id", "plan_weeks", ["plan_id"])
+    op.create_index("ix_checkins_athlete_id", "checkins", ["athlete_id"])
@@ -0,0 +1,28 @@
+"""add partial index on open coach notes tasks
+
+Revision ID: 20260211_0009
+Revises: 20260211_0008
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260211_0009"
+down_revision = "20260211_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_coach_notes_open",
+        "coach_notes_tasks",
+        ["athlete_id", "due_date"],
+        postgresql_where=sa.text("completed = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_coach_notes_open", table_name="coach_notes_tasks")
@@ -0,0 +1,33 @@
+"""cover training log load columns in uq_training_log_athlete_date
+
+Revision ID: 20260211_0010
+Revises: 20260211_0009
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+
+
+revision = "20260211_0010"
+down_revision = "20260211_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLAlchemy 2.0 has no postgresql_include for unique constraints, so the INCLUDE is spelled out.
+    op.drop_constraint("uq_training_log_athlete_date", "training_logs", type_="unique")
+    op.execute(
+        "ALTER TABLE training_logs ADD CONSTRAINT uq_training_log_athlete_date "
+        "UNIQUE (athlete_id, date) INCLUDE (load_score, duration_min, distance_km, rpe)"
+    )
+    # The unique index leads with athlete_id, so these plain indexes are redundant.
+    op.drop_index("ix_logs_athlete_date", table_name="training_logs")
+    op.drop_index("ix_training_logs_athlete_id", table_name="training_logs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_training_logs_athlete_id", "training_logs", ["athlete_id"])
+    op.create_index("ix_logs_athlete_date", "training_logs", ["athlete_id", "date"])
+    op.drop_constraint("uq_training_log_athlete_date", "training_logs", type_="unique")
+    op.create_unique_constraint("uq_training_log_athlete_date", "training_logs", ["athlete_id", "date"])
@@ -0,0 +1,43 @@
+"""convert payload/contract JSON columns to JSONB
+
+Revision ID: 20260211_0011
+Revises: 20260211_0010
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260211_0011"
+down_revision = "20260211_0010"
+branch_labels = None
+depends_on = None
+
+# (table, column, server default)
+_COLUMNS = [
+    ("sessions_library", "structure_json", "{}"),
+    ("sessions_library", "targets_json", "{}"),
+    ("coach_action_logs", "payload", "{}"),
+    ("coach_interventions", "expected_impact", "{}"),
+    ("coach_interventions", "why_factors", "[]"),
+    ("app_write_logs", "payload", "{}"),
+    ("import_items", "raw_payload", "{}"),
+]
+
+
+def _convert(type_: sa.types.TypeEngine, cast: str) -> None:
+    # The json-typed defaults do not cast implicitly, so drop and restore them around the type change.
+    for table, column, default in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(table, column, type_=type_, postgresql_using=f"{column}::{cast}")
+        op.alter_column(table, column, server_default=default)
+
+
+def upgrade() -> None:
+    _convert(postgresql.JSONB(), "jsonb")
+
+
+def downgrade() -> None:
+    _convert(sa.JSON(), "json")
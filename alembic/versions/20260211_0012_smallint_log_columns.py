@@ -0,0 +1,36 @@
+"""narrow training log and check-in score columns to smallint
+
+Revision ID: 20260211_0012
+Revises: 20260211_0011
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260211_0012"
+down_revision = "20260211_0011"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("training_logs", "duration_min"),
+    ("training_logs", "avg_hr"),
+    ("training_logs", "max_hr"),
+    ("training_logs", "rpe"),
+    ("checkins", "sleep"),
+    ("checkins", "energy"),
+    ("checkins", "recovery"),
+    ("checkins", "stress"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, type_=sa.SmallInteger(), existing_type=sa.Integer(), postgresql_using=f"{column}::smallint")
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, type_=sa.Integer(), existing_type=sa.SmallInteger())
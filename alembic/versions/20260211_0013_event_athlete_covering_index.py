@@ -0,0 +1,29 @@
+"""replace ix_events_athlete_id with a covering (athlete_id, event_date) index
+
+Revision ID: 20260211_0013
+Revises: 20260211_0012
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+
+
+revision = "20260211_0013"
+down_revision = "20260211_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_athlete_cov",
+        "events",
+        ["athlete_id", "event_date"],
+        postgresql_include=["id", "name", "distance"],
+    )
+    op.drop_index("ix_events_athlete_id", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_athlete_id", "events", ["athlete_id"])
+    op.drop_index("ix_event_athlete_cov", table_name="events")
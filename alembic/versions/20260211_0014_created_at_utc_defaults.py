@@ -0,0 +1,36 @@
+"""fill created_at with UTC wall-clock time regardless of session TimeZone
+
+Revision ID: 20260211_0014
+Revises: 20260211_0013
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260211_0014"
+down_revision = "20260211_0013"
+branch_labels = None
+depends_on = None
+
+_TABLES = [
+    "athletes",
+    "coach_action_logs",
+    "coach_interventions",
+    "app_write_logs",
+    "app_runtime_errors",
+    "import_runs",
+]
+
+
+def upgrade() -> None:
+    # created_at is timestamp without time zone and compared against datetime.utcnow(),
+    # so plain now() would store session-local time on non-UTC servers.
+    for table in _TABLES:
+        op.alter_column(table, "created_at", server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, "created_at", server_default=sa.text("now()"))
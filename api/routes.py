@@ -5,8 +5,11 @@ from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import undefer
 
 from api.auth import (
     TokenData,
@@ -52,11 +55,12 @@ router = APIRouter(prefix="/api/v1")
 def login(request: Request, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
     enforce_rate_limit(request, key="auth_token", max_requests=5, window_seconds=60)
     with session_scope() as s:
-        user = s.execute(select(User).where(User.username == form_data.username)).scalar_one_or_none()
-        if not user or not __import__("core.security", fromlist=["verify_password"]).verify_password(form_data.password, user.password_hash):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-        token = create_access_token({"sub": user.username, "user_id": user.id, "role": user.role, "athlete_id": user.athlete_id})
-        return TokenResponse(access_token=token, role=user.role, user_id=user.id, athlete_id=user.athlete_id)
+        user = s.execute(select(User.id, User.username, User.role, User.athlete_id, User.password_hash).where(User.username == form_data.username)).one_or_none()
+    # Verify outside the session so bcrypt does not pin a pooled connection.
+    if not user or not __import__("core.security", fromlist=["verify_password"]).verify_password(form_data.password, user.password_hash):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    token = create_access_token({"sub": user.username, "user_id": user.id, "role": user.role, "athlete_id": user.athlete_id})
+    return TokenResponse(access_token=token, role=user.role, user_id=user.id, athlete_id=user.athlete_id)
 
 
 @router.get("/auth/me", response_model=TokenData, tags=["auth"])
@@ -88,7 +92,7 @@ def list_athletes(
             q = q.where(Athlete.status == status_filter)
             c = c.where(Athlete.status == status_filter)
         rows = s.execute(q.order_by(Athlete.first_name, Athlete.last_name).offset(offset).limit(limit)).scalars().all()
-        total = s.execute(c).scalar_one()
+        total = _page_total(s, c, offset, limit, len(rows))
         return PaginatedResponse[AthleteOut](items=[AthleteOut.model_validate(r) for r in rows], total=total, offset=offset, limit=limit)
 
 
@@ -105,20 +109,22 @@ def get_athlete(athlete_id: int, current_user: Annotated[TokenData, Depends(get_
 
 @router.post("/athletes", response_model=AthleteOut, status_code=201, tags=["athletes"])
 async def create_athlete(body: ClientCreateInput, coach: Annotated[TokenData, Depends(require_coach)]):
+    # bcrypt is deliberately slow; hash in the threadpool, before any DB connection is checked out.
+    password_hash = await run_in_threadpool(hash_password, body.temp_password)
     with session_scope() as s:
-        existing = s.execute(select(Athlete).where(Athlete.email == body.email)).scalar_one_or_none()
-        if existing:
+        if s.execute(select(exists().where(Athlete.email == body.email))).scalar():
             raise HTTPException(status_code=409, detail="Email already in use")
         ath = Athlete(first_name=body.first_name, last_name=body.last_name, email=body.email, dob=body.dob)
         s.add(ath)
         s.flush()
         base_username = f"{body.first_name.lower()}.{body.last_name.lower()}"
+        taken = set(s.execute(select(User.username).where(User.username.startswith(base_username, autoescape=True))).scalars())
         username = base_username
         suffix = 1
-        while s.execute(select(User).where(User.username == username)).scalar_one_or_none():
+        while username in taken:
             suffix += 1
             username = f"{base_username}{suffix}"
-        user = User(username=username, password_hash=hash_password(body.temp_password), role="client", athlete_id=ath.id)
+        user = User(username=username, password_hash=password_hash, role="client", athlete_id=ath.id)
         s.add(user)
         s.flush()
         result = AthleteOut.model_validate(ath)
@@ -128,26 +134,20 @@ async def create_athlete(body: ClientCreateInput, coach: Annotated[TokenData, De
 
 @router.post("/checkins", response_model=CheckInOut, status_code=201, tags=["checkins"])
 async def create_checkin(body: CheckInInput, athlete: Annotated[TokenData, Depends(require_athlete)]):
+    athlete_id = athlete.athlete_id
     today = date.today()
+    stmt = pg_insert(CheckIn).values(athlete_id=athlete_id, day=today, sleep=body.sleep, energy=body.energy, recovery=body.recovery, stress=body.stress, training_today=body.training_today)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_checkin_athlete_day",
+        set_={col: stmt.excluded[col] for col in ("sleep", "energy", "recovery", "stress", "training_today")},
+    ).returning(CheckIn)
     with session_scope() as s:
-        existing = s.execute(select(CheckIn).where(CheckIn.athlete_id == athlete.athlete_id, CheckIn.day == today)).scalar_one_or_none()
-        if existing:
-            existing.sleep = body.sleep
-            existing.energy = body.energy
-            existing.recovery = body.recovery
-            existing.stress = body.stress
-            existing.training_today = body.training_today
-            s.flush()
-            obj = existing
-        else:
-            obj = CheckIn(athlete_id=athlete.athlete_id, day=today, sleep=body.sleep, energy=body.energy, recovery=body.recovery, stress=body.stress, training_today=body.training_today)
-            s.add(obj)
-            s.flush()
+        obj = s.execute(stmt).scalar_one()
         score = readiness_score(obj.sleep, obj.energy, obj.recovery, obj.stress)
         result = CheckInOut.model_validate(obj)
         result.readiness_score = score
         result.readiness_band = readiness_band(score)
-    payload = {"athlete_id": athlete.athlete_id, "day": str(today), "readiness": score}
+    payload = {"athlete_id": athlete_id, "day": str(today), "readiness": score}
     await dispatch_event("checkin.created", payload)
     await manager.broadcast("coach", "checkin.created", payload)
     return result
@@ -158,7 +158,7 @@ def list_checkins(current_user: Annotated[TokenData, Depends(get_current_user)],
     target_id = _resolve_athlete_id(current_user, athlete_id)
     with session_scope() as s:
         rows = s.execute(select(CheckIn).where(CheckIn.athlete_id == target_id).order_by(CheckIn.day.desc()).offset(offset).limit(limit)).scalars().all()
-        total = s.execute(select(func.count()).select_from(CheckIn).where(CheckIn.athlete_id == target_id)).scalar_one()
+        total = _page_total(s, select(func.count()).select_from(CheckIn).where(CheckIn.athlete_id == target_id), offset, limit, len(rows))
         items: list[CheckInOut] = []
         for r in rows:
             out = CheckInOut.model_validate(r)
@@ -171,29 +171,35 @@ def list_checkins(current_user: Annotated[TokenData, Depends(get_current_user)],
 
 @router.post("/training-logs", response_model=TrainingLogOut, status_code=201, tags=["training-logs"])
 async def create_training_log(body: TrainingLogInput, athlete: Annotated[TokenData, Depends(require_athlete)]):
+    """Record today's training log. One log is kept per athlete per day; posting again replaces it."""
+    athlete_id = athlete.athlete_id
     today = date.today()
     load = float(body.duration_min) * (body.rpe / 10)
+    stmt = pg_insert(TrainingLog).values(
+        athlete_id=athlete_id,
+        date=today,
+        session_category=body.session_category,
+        duration_min=body.duration_min,
+        distance_km=body.distance_km,
+        avg_hr=body.avg_hr,
+        max_hr=body.max_hr,
+        avg_pace_sec_per_km=body.avg_pace_sec_per_km,
+        rpe=body.rpe,
+        load_score=load,
+        notes=body.notes,
+        pain_flag=body.pain_flag,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_training_log_athlete_date",
+        set_={
+            col: stmt.excluded[col]
+            for col in ("session_category", "duration_min", "distance_km", "avg_hr", "max_hr", "avg_pace_sec_per_km", "rpe", "load_score", "notes", "pain_flag")
+        },
+    ).returning(TrainingLog).options(undefer(TrainingLog.notes))
     with session_scope() as s:
-        existing = s.execute(select(TrainingLog).where(TrainingLog.athlete_id == athlete.athlete_id, TrainingLog.date == today)).scalar_one_or_none()
-        if existing:
-            existing.session_category = body.session_category
-            existing.duration_min = body.duration_min
-            existing.distance_km = body.distance_km
-            existing.avg_hr = body.avg_hr
-            existing.max_hr = body.max_hr
-            existing.avg_pace_sec_per_km = body.avg_pace_sec_per_km
-            existing.rpe = body.rpe
-            existing.load_score = load
-            existing.notes = body.notes
-            existing.pain_flag = body.pain_flag
-            s.flush()
-            obj = existing
-        else:
-            obj = TrainingLog(athlete_id=athlete.athlete_id, date=today, session_category=body.session_category, duration_min=body.duration_min, distance_km=body.distance_km, avg_hr=body.avg_hr, max_hr=body.max_hr, avg_pace_sec_per_km=body.avg_pace_sec_per_km, rpe=body.rpe, load_score=load, notes=body.notes, pain_flag=body.pain_flag)
-            s.add(obj)
-            s.flush()
+        obj = s.execute(stmt).scalar_one()
         result = TrainingLogOut.model_validate(obj)
-    payload = {"athlete_id": athlete.athlete_id, "date": str(today), "rpe": body.rpe, "pain": body.pain_flag}
+    payload = {"athlete_id": athlete_id, "date": str(today), "rpe": body.rpe, "pain": body.pain_flag}
     await dispatch_event("training_log.created", payload)
     await manager.broadcast("coach", "training_log.created", payload)
     return result
@@ -203,8 +209,8 @@ async def create_training_log(body: TrainingLogInput, athlete: Annotated[TokenDa
 def list_training_logs(current_user: Annotated[TokenData, Depends(get_current_user)], athlete_id: int | None = None, offset: int = Query(0, ge=0), limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size)):
     target_id = _resolve_athlete_id(current_user, athlete_id)
     with session_scope() as s:
-        rows = s.execute(select(TrainingLog).where(TrainingLog.athlete_id == target_id).order_by(TrainingLog.date.desc()).offset(offset).limit(limit)).scalars().all()
-        total = s.execute(select(func.count()).select_from(TrainingLog).where(TrainingLog.athlete_id == target_id)).scalar_one()
+        rows = s.execute(select(TrainingLog).options(undefer(TrainingLog.notes)).where(TrainingLog.athlete_id == target_id).order_by(TrainingLog.date.desc()).offset(offset).limit(limit)).scalars().all()
+        total = _page_total(s, select(func.count()).select_from(TrainingLog).where(TrainingLog.athlete_id == target_id), offset, limit, len(rows))
         return PaginatedResponse[TrainingLogOut](items=[TrainingLogOut.model_validate(r) for r in rows], total=total, offset=offset, limit=limit)
 
 
@@ -242,7 +248,7 @@ def list_plans(current_user: Annotated[TokenData, Depends(get_current_user)], at
 @router.get("/plans/{plan_id}/weeks", response_model=list[PlanWeekOut], tags=["plans"])
 def get_plan_weeks(plan_id: int, current_user: Annotated[TokenData, Depends(get_current_user)]):
     with session_scope() as s:
-        plan = s.get(Plan, plan_id)
+        plan = s.execute(select(Plan.athlete_id).where(Plan.id == plan_id)).first()
         if not plan:
             raise HTTPException(status_code=404, detail="Plan not found")
         if current_user.role == "client" and current_user.athlete_id != plan.athlete_id:
@@ -254,28 +260,28 @@ def get_plan_weeks(plan_id: int, current_user: Annotated[TokenData, Depends(get_
 @router.get("/plans/{plan_id}/sessions", response_model=list[PlanDaySessionOut], tags=["plans"])
 def get_plan_sessions(plan_id: int, current_user: Annotated[TokenData, Depends(get_current_user)]):
     with session_scope() as s:
-        plan = s.get(Plan, plan_id)
+        plan = s.execute(select(Plan.athlete_id).where(Plan.id == plan_id)).first()
         if not plan:
             raise HTTPException(status_code=404, detail="Plan not found")
         if current_user.role == "client" and current_user.athlete_id != plan.athlete_id:
             raise HTTPException(status_code=403, detail="Access denied")
-        week_ids = [w.id for w in s.execute(select(PlanWeek).where(PlanWeek.plan_id == plan_id)).scalars().all()]
-        if not week_ids:
-            return []
-        rows = s.execute(select(PlanDaySession).where(PlanDaySession.plan_week_id.in_(week_ids)).order_by(PlanDaySession.session_day)).scalars().all()
+        rows = s.execute(
+            select(PlanDaySession).join(PlanWeek, PlanWeek.id == PlanDaySession.plan_week_id).where(PlanWeek.plan_id == plan_id).order_by(PlanDaySession.session_day)
+        ).scalars().all()
         return [PlanDaySessionOut.model_validate(r) for r in rows]
 
 
-@router.get("/interventions", response_model=list[InterventionOut], tags=["interventions"])
-def list_interventions(coach: Annotated[TokenData, Depends(require_coach)], status_filter: str = Query("open", alias="status"), athlete_id: int | None = None):
+@router.get("/interventions", response_model=PaginatedResponse[InterventionOut], tags=["interventions"])
+def list_interventions(coach: Annotated[TokenData, Depends(require_coach)], status_filter: str = Query("open", alias="status"), athlete_id: int | None = None, offset: int = Query(0, ge=0), limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size)):
     with session_scope() as s:
-        q = select(CoachIntervention)
+        filters = []
         if status_filter != "all":
-            q = q.where(CoachIntervention.status == status_filter)
+            filters.append(CoachIntervention.status == status_filter)
         if athlete_id:
-            q = q.where(CoachIntervention.athlete_id == athlete_id)
-        rows = s.execute(q.order_by(CoachIntervention.risk_score.desc())).scalars().all()
-        return [InterventionOut.model_validate(r) for r in rows]
+            filters.append(CoachIntervention.athlete_id == athlete_id)
+        rows = s.execute(select(CoachIntervention).where(*filters).order_by(CoachIntervention.risk_score.desc(), CoachIntervention.id).offset(offset).limit(limit)).scalars().all()
+        total = _page_total(s, select(func.count()).select_from(CoachIntervention).where(*filters), offset, limit, len(rows))
+        return PaginatedResponse[InterventionOut](items=[InterventionOut.model_validate(r) for r in rows], total=total, offset=offset, limit=limit)
 
 
 @router.post("/interventions/sync", response_model=MessageOut, tags=["interventions"])
@@ -299,8 +305,7 @@ def decide_intervention(intervention_id: int, body: InterventionDecisionInput, c
 @router.get("/athletes/{athlete_id}/recommendation", response_model=RecommendationOut, tags=["recommendations"])
 def get_recommendation(athlete_id: int, coach: Annotated[TokenData, Depends(require_coach)]):
     with session_scope() as s:
-        athlete = s.get(Athlete, athlete_id)
-        if not athlete:
+        if not s.execute(select(Athlete.id).where(Athlete.id == athlete_id)).first():
             raise HTTPException(status_code=404, detail="Athlete not found")
         signals = collect_athlete_signals(s, athlete_id, date.today())
         rec = compose_recommendation(signals)
@@ -334,3 +339,10 @@ def _resolve_athlete_id(current_user: TokenData, requested_id: int | None) -> in
     if requested_id:
         return requested_id
     raise HTTPException(status_code=400, detail="athlete_id query parameter required for coaches")
+
+
+def _page_total(s, count_stmt, offset: int, limit: int, page_len: int) -> int:
+    """Derive the total from a short page when possible; COUNT(*) only when the page is full or past the end."""
+    if page_len < limit and (page_len or not offset):
+        return offset + page_len
+    return s.execute(count_stmt).scalar_one()
@@ -19,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 # In-memory registry (upgrade to DB table for production persistence)
 _webhooks: dict[str, dict] = {}
+# event type -> ids of subscribed hooks (insertion-ordered); ids no longer in _webhooks are skipped
+_hook_ids_by_event: dict[str, dict[str, None]] = {}
 
 VALID_EVENTS = {
     "checkin.created",
@@ -37,14 +39,18 @@ def register_webhook(url: str, events: list[str], secret: str | None = None) ->
         raise ValueError(f"Invalid events: {invalid}. Valid: {sorted(VALID_EVENTS)}")
     hook_id = uuid4().hex[:12]
     _webhooks[hook_id] = {"id": hook_id, "url": url, "events": events, "secret": secret, "active": True}
+    for event in events:
+        _hook_ids_by_event.setdefault(event, {})[hook_id] = None
     logger.info("Webhook registered: id=%s url=%s events=%s", hook_id, url, events)
     return _webhooks[hook_id]
 
 
 def unregister_webhook(hook_id: str) -> bool:
     """Remove a webhook by ID. Returns True if found and removed."""
-    if hook_id in _webhooks:
-        del _webhooks[hook_id]
+    hook = _webhooks.pop(hook_id, None)
+    if hook is not None:
+        for event in hook["events"]:
+            _hook_ids_by_event.get(event, {}).pop(hook_id, None)
         logger.info("Webhook unregistered: id=%s", hook_id)
         return True
     return False
@@ -62,7 +68,11 @@ def _sign_payload(payload: str, secret: str) -> str:
 
 async def dispatch_event(event_type: str, data: dict[str, Any]) -> int:
     """Fire webhook callbacks for an event type. Returns count of dispatches sent."""
-    subscribers = [h for h in _webhooks.values() if h["active"] and event_type in h["events"]]
+    subscribers = [
+        hook
+        for hook_id in _hook_ids_by_event.get(event_type, ())
+        if (hook := _webhooks.get(hook_id)) is not None and hook["active"] and event_type in hook["events"]
+    ]
     if not subscribers:
         return 0
 
@@ -1,28 +1,38 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
 
 from core.db import session_scope
 from core.models import Athlete, SessionLibrary, User
 from core.security import hash_password
 
+# Set once seeding has been verified or completed in this process; later
+# calls skip the DB entirely.
+_SEEDED = False
+
 
 def ensure_demo_seeded() -> bool:
     """
     Ensure demo auth users/data exist for Streamlit deployments where seed.py
     has not been run manually.
     """
+    global _SEEDED
+    if _SEEDED:
+        return False
     try:
         with session_scope() as s:
-            coach = s.execute(select(User.id).where(User.username == "coach")).scalar_one_or_none()
-            has_sessions = s.execute(select(SessionLibrary.id)).first() is not None
-            if coach and has_sessions:
+            has_coach, has_sessions = s.execute(
+                select(exists().where(User.username == "coach"), exists().select_from(SessionLibrary))
+            ).one()
+            if has_coach and has_sessions:
                 from db.seed import backfill_plan_day_sessions
 
                 backfill_plan_day_sessions()
                 _reconcile_demo_credentials()
+                _SEEDED = True
                 return False
     except Exception:
         # Tables may not exist yet; continue into migration/seed path.
@@ -35,6 +45,7 @@ def ensure_demo_seeded() -> bool:
     seed_users_athletes()
     backfill_plan_day_sessions()
     _reconcile_demo_credentials()
+    _SEEDED = True
     return True
 
 
@@ -43,18 +54,27 @@ def _reconcile_demo_credentials() -> None:
     Ensure default demo login credentials are valid even when the database
     already exists with drifted user records/passwords.
     """
+    # Hash both demo passwords concurrently (bcrypt releases the GIL) before
+    # opening the session, so the transaction is not held across bcrypt.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        coach_hash, athlete_hash = pool.map(hash_password, ["CoachPass!234", "AthletePass!234"])
+
     with session_scope() as s:
-        coach = s.execute(select(User).where(User.username == "coach")).scalar_one_or_none()
+        users = {
+            u.username: u
+            for u in s.execute(select(User).where(User.username.in_(["coach", "athlete1"]))).scalars()
+        }
+        coach = users.get("coach")
         if coach is None:
             coach = User(
                 username="coach",
                 role="coach",
-                password_hash=hash_password("CoachPass!234"),
+                password_hash=coach_hash,
                 must_change_password=False,
             )
             s.add(coach)
         else:
-            coach.password_hash = hash_password("CoachPass!234")
+            coach.password_hash = coach_hash
             coach.must_change_password = False
             coach.failed_attempts = 0
             coach.locked_until = None
@@ -65,20 +85,20 @@ def _reconcile_demo_credentials() -> None:
             s.add(athlete)
             s.flush()
 
-        athlete_user = s.execute(select(User).where(User.username == "athlete1")).scalar_one_or_none()
+        athlete_user = users.get("athlete1")
         if athlete_user is None:
             athlete_user = User(
                 username="athlete1",
                 role="client",
                 athlete_id=athlete.id,
-                password_hash=hash_password("AthletePass!234"),
+                password_hash=athlete_hash,
                 must_change_password=False,
             )
             s.add(athlete_user)
         else:
             athlete_user.athlete_id = athlete.id
             athlete_user.role = "client"
-            athlete_user.password_hash = hash_password("AthletePass!234")
+            athlete_user.password_hash = athlete_hash
             athlete_user.must_change_password = False
             athlete_user.failed_attempts = 0
             athlete_user.locked_until = None
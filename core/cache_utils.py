@@ -1,22 +1,54 @@
 from __future__ import annotations
 
-from time import time
+import heapq
+from collections import OrderedDict
+from time import monotonic_ns
 
 
 class TTLCache:
-    def __init__(self, ttl_seconds: int = 60):
+    """Bounded LRU cache whose entries also expire ttl_seconds after being set."""
+
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 1024):
         self.ttl = ttl_seconds
-        self._store: dict[str, tuple[float, object]] = {}
+        self.max_entries = max_entries
+        self._ttl_ns = int(ttl_seconds * 1_000_000_000)
+        # key -> (expiry in monotonic ns, value), least recently used first
+        self._store: OrderedDict[str, tuple[int, object]] = OrderedDict()
+        # (expiry, key) min-heap; entries for overwritten or evicted keys are skipped lazily
+        self._expiries: list[tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._store)
 
     def set(self, key: str, value: object) -> None:
-        self._store[key] = (time(), value)
+        now = monotonic_ns()
+        expires_at = now + self._ttl_ns
+        self._store[key] = (expires_at, value)
+        self._store.move_to_end(key)
+        heapq.heappush(self._expiries, (expires_at, key))
+        self._evict(now)
 
     def get(self, key: str):
         item = self._store.get(key)
         if not item:
             return None
-        ts, val = item
-        if time() - ts > self.ttl:
+        expires_at, val = item
+        if monotonic_ns() > expires_at:
             self._store.pop(key, None)
             return None
+        self._store.move_to_end(key)
         return val
+
+    def _evict(self, now: int) -> None:
+        heap = self._expiries
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            item = self._store.get(key)
+            if item is not None and item[0] == expires_at:
+                del self._store[key]
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+        if len(heap) > 2 * len(self._store) + 16:
+            # Drop heap entries whose key was overwritten or evicted.
+            heap[:] = [(exp, k) for k, (exp, _) in self._store.items()]
+            heapq.heapify(heap)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 
 from sqlalchemy import create_engine
@@ -11,22 +12,24 @@ from core.config import get_settings
 Base = declarative_base()
 
 
-_engine = None
-_SessionLocal = None
-
-
+@lru_cache(maxsize=1)
 def get_engine():
-    global _engine
-    if _engine is None:
-        _engine = create_engine(get_settings().database_url, future=True, pool_pre_ping=True)
-    return _engine
-
-
+    settings = get_settings()
+    return create_engine(
+        settings.database_url,
+        future=True,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        # Reuse the most recently returned connection so idle ones can age out.
+        pool_use_lifo=True,
+    )
+
+
+@lru_cache(maxsize=1)
 def get_session_factory():
-    global _SessionLocal
-    if _SessionLocal is None:
-        _SessionLocal = sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, future=True)
-    return _SessionLocal
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, future=True)
 
 
 @contextmanager
@@ -1,9 +1,36 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson
+
+    # Route datetimes/dataclasses through `default=str` so output matches json.dumps.
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def _dumps(obj: dict) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles those.
+            pass
+    return json.dumps(obj, default=str)
+
+
+def _message(record: logging.LogRecord) -> str:
+    # Same result as record.getMessage() without the %-formatting step when there are no args.
+    return record.getMessage() if record.args else str(record.msg)
 
 
 class JSONFormatter(logging.Formatter):
@@ -11,10 +38,10 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": _message(record),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -27,7 +54,18 @@ class JSONFormatter(logging.Formatter):
         extra = {k: v for k, v in record.__dict__.items() if k.startswith("ctx_")}
         if extra:
             log_entry["context"] = extra
-        return json.dumps(log_entry, default=str)
+        return _dumps(log_entry)
+
+
+class _EnqueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting (including exc_info) to the listener's JSONFormatter."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now so later mutation of them cannot change the message.
+        record = copy.copy(record)
+        record.msg = _message(record)
+        record.args = None
+        return record
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -36,9 +74,16 @@ def setup_logging(level: str = "INFO") -> None:
     if root.handlers:
         return
 
+    # Callers only enqueue; a background listener formats and writes to stdout.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(JSONFormatter())
-    root.addHandler(handler)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    queue_handler = _EnqueueHandler(log_queue)
+    queue_handler.listener = listener
+    root.addHandler(queue_handler)
     root.setLevel(getattr(logging, level.upper(), logging.INFO))
 
     # Reduce noise from third-party libraries
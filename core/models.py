@@ -13,10 +13,14 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Text,
     UniqueConstraint,
+    false,
+    func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.db import Base
@@ -35,7 +39,8 @@ class Athlete(Base):
     easy_pace_sec_per_km: Mapped[Optional[int]] = mapped_column(Integer)
     vdot_score: Mapped[Optional[int]] = mapped_column(Integer)
     status: Mapped[str] = mapped_column(String(20), default="active", index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.timezone("utc", func.now()))
+    users: Mapped[list[User]] = relationship(back_populates="athlete", lazy="raise")
 
 
 class User(Base):
@@ -49,7 +54,7 @@ class User(Base):
     failed_attempts: Mapped[int] = mapped_column(Integer, default=0)
     locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime)
     last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
-    athlete = relationship("Athlete")
+    athlete: Mapped[Optional[Athlete]] = relationship(back_populates="users", lazy="raise")
 
 
 class SessionLibrary(Base):
@@ -62,12 +67,12 @@ class SessionLibrary(Base):
     tier: Mapped[str] = mapped_column(String(30), default="medium")
     is_treadmill: Mapped[bool] = mapped_column(Boolean, default=False)
     duration_min: Mapped[int] = mapped_column(Integer)
-    structure_json: Mapped[dict] = mapped_column(JSON, default=dict)
-    targets_json: Mapped[dict] = mapped_column(JSON, default=dict)
-    progression_json: Mapped[dict] = mapped_column(JSON, default=dict)
-    regression_json: Mapped[dict] = mapped_column(JSON, default=dict)
-    prescription: Mapped[str] = mapped_column(Text, default="")
-    coaching_notes: Mapped[str] = mapped_column(Text, default="")
+    structure_json: Mapped[dict] = mapped_column(JSONB, default=dict, deferred=True, deferred_group="contract")
+    targets_json: Mapped[dict] = mapped_column(JSONB, default=dict, deferred=True, deferred_group="contract")
+    progression_json: Mapped[dict] = mapped_column(JSON, default=dict, deferred=True, deferred_group="contract")
+    regression_json: Mapped[dict] = mapped_column(JSON, default=dict, deferred=True, deferred_group="contract")
+    prescription: Mapped[str] = mapped_column(Text, default="", deferred=True, deferred_group="contract")
+    coaching_notes: Mapped[str] = mapped_column(Text, default="", deferred=True, deferred_group="contract")
 
 
 class Plan(Base):
@@ -86,7 +91,7 @@ class Plan(Base):
 class PlanWeek(Base):
     __tablename__ = "plan_weeks"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    plan_id: Mapped[int] = mapped_column(ForeignKey("plans.id"), index=True)
+    plan_id: Mapped[int] = mapped_column(ForeignKey("plans.id"))
     week_number: Mapped[int] = mapped_column(Integer, nullable=False)
     phase: Mapped[str] = mapped_column(String(30), nullable=False)
     week_start: Mapped[date] = mapped_column(Date, nullable=False)
@@ -101,7 +106,7 @@ class PlanDaySession(Base):
     __tablename__ = "plan_day_sessions"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     plan_week_id: Mapped[int] = mapped_column(ForeignKey("plan_weeks.id"), index=True)
-    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"), index=True)
+    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"))
     session_day: Mapped[date] = mapped_column(Date, index=True)
     session_name: Mapped[str] = mapped_column(String(200), nullable=False)
     source_template_name: Mapped[str] = mapped_column(String(200), nullable=False, default="")
@@ -123,7 +128,7 @@ class PlanWeekMetric(Base):
 class Event(Base):
     __tablename__ = "events"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"), index=True)
+    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"))
     name: Mapped[str] = mapped_column(String(140), nullable=False)
     event_date: Mapped[date] = mapped_column(Date, nullable=False)
     distance: Mapped[str] = mapped_column(String(30), nullable=False)
@@ -132,12 +137,12 @@ class Event(Base):
 class CheckIn(Base):
     __tablename__ = "checkins"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"), index=True)
+    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"))
     day: Mapped[date] = mapped_column(Date, nullable=False)
-    sleep: Mapped[int] = mapped_column(Integer, nullable=False)
-    energy: Mapped[int] = mapped_column(Integer, nullable=False)
-    recovery: Mapped[int] = mapped_column(Integer, nullable=False)
-    stress: Mapped[int] = mapped_column(Integer, nullable=False)
+    sleep: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    energy: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    recovery: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    stress: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     training_today: Mapped[bool] = mapped_column(Boolean, default=True)
     __table_args__ = (
         UniqueConstraint("athlete_id", "day", name="uq_checkin_athlete_day"),
@@ -151,23 +156,26 @@ class CheckIn(Base):
 class TrainingLog(Base):
     __tablename__ = "training_logs"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"), index=True)
+    athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"))
     date: Mapped[date] = mapped_column(Date, index=True)
     session_category: Mapped[str] = mapped_column(String(80))
-    duration_min: Mapped[int] = mapped_column(Integer)
+    duration_min: Mapped[int] = mapped_column(SmallInteger)
     distance_km: Mapped[float] = mapped_column(Float, default=0)
-    avg_hr: Mapped[Optional[int]] = mapped_column(Integer)
-    max_hr: Mapped[Optional[int]] = mapped_column(Integer)
+    avg_hr: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    max_hr: Mapped[Optional[int]] = mapped_column(SmallInteger)
     avg_pace_sec_per_km: Mapped[Optional[float]] = mapped_column(Float)
-    rpe: Mapped[int] = mapped_column(Integer)
+    rpe: Mapped[int] = mapped_column(SmallInteger)
     load_score: Mapped[float] = mapped_column(Float, default=0)
-    notes: Mapped[str] = mapped_column(Text, default="")
+    notes: Mapped[str] = mapped_column(Text, default="", deferred=True)
     pain_flag: Mapped[bool] = mapped_column(Boolean, default=False)
     __table_args__ = (
         CheckConstraint("duration_min >= 0"),
         CheckConstraint("distance_km >= 0"),
         CheckConstraint("rpe between 1 and 10"),
         CheckConstraint("load_score >= 0"),
+        # Migration 20260211_0010 adds INCLUDE (load_score, duration_min, distance_km, rpe) on Postgres;
+        # SQLAlchemy 2.0 cannot declare INCLUDE on a UniqueConstraint.
+        UniqueConstraint("athlete_id", "date", name="uq_training_log_athlete_date"),
     )
 
 
@@ -185,8 +193,8 @@ class CoachActionLog(Base):
     coach_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id"), index=True)
     action: Mapped[str] = mapped_column(String(80), nullable=False)
-    payload: Mapped[dict] = mapped_column(JSON, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    payload: Mapped[dict] = mapped_column(JSONB, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.timezone("utc", func.now()))
 
 
 class CoachNotesTask(Base):
@@ -206,12 +214,12 @@ class CoachIntervention(Base):
     status: Mapped[str] = mapped_column(String(30), default="open")
     risk_score: Mapped[float] = mapped_column(Float, default=0)
     confidence_score: Mapped[float] = mapped_column(Float, default=0)
-    expected_impact: Mapped[dict] = mapped_column(JSON, default=dict)
-    why_factors: Mapped[list] = mapped_column(JSON, default=list)
+    expected_impact: Mapped[dict] = mapped_column(JSONB, default=dict)
+    why_factors: Mapped[list] = mapped_column(JSONB, default=list)
     guardrail_pass: Mapped[bool] = mapped_column(Boolean, default=True)
     guardrail_reason: Mapped[str] = mapped_column(String(255), default="ok")
     cooldown_until: Mapped[Optional[datetime]] = mapped_column(DateTime)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.timezone("utc", func.now()))
 
 
 class AthletePreference(Base):
@@ -232,8 +240,8 @@ class AppWriteLog(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     scope: Mapped[str] = mapped_column(String(80))
     actor_user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"))
-    payload: Mapped[dict] = mapped_column(JSON, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    payload: Mapped[dict] = mapped_column(JSONB, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.timezone("utc", func.now()))
 
 
 class AppRuntimeError(Base):
@@ -241,8 +249,8 @@ class AppRuntimeError(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     page: Mapped[str] = mapped_column(String(80))
     error_message: Mapped[str] = mapped_column(Text)
-    traceback: Mapped[str] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    traceback: Mapped[str] = mapped_column(Text, deferred=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.timezone("utc", func.now()))
 
 
 class ImportRun(Base):
@@ -250,7 +258,7 @@ class ImportRun(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     adapter_name: Mapped[str] = mapped_column(String(80), nullable=False)
     status: Mapped[str] = mapped_column(String(20), default="started")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.timezone("utc", func.now()))
 
 
 class ImportItem(Base):
@@ -258,10 +266,12 @@ class ImportItem(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     import_run_id: Mapped[int] = mapped_column(ForeignKey("import_runs.id"), index=True)
     athlete_id: Mapped[Optional[int]] = mapped_column(ForeignKey("athletes.id"))
-    raw_payload: Mapped[dict] = mapped_column(JSON, default=dict)
+    raw_payload: Mapped[dict] = mapped_column(JSONB, default=dict)
     status: Mapped[str] = mapped_column(String(20), default="pending")
     message: Mapped[str] = mapped_column(String(255), default="")
 
 
-Index("ix_logs_athlete_date", TrainingLog.athlete_id, TrainingLog.date)
 Index("ix_intervention_open", CoachIntervention.athlete_id, CoachIntervention.action_type, unique=False, postgresql_where=(CoachIntervention.status == "open"))
+Index("ix_plan_active_by_athlete", Plan.athlete_id, postgresql_where=(Plan.status == "active"))
+Index("ix_coach_notes_open", CoachNotesTask.athlete_id, CoachNotesTask.due_date, postgresql_where=(CoachNotesTask.completed == false()))
+Index("ix_event_athlete_cov", Event.athlete_id, Event.event_date, postgresql_include=["id", "name", "distance"])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
 import re
 from datetime import datetime, timedelta, timezone
 
@@ -19,10 +20,14 @@ except Exception:  # pragma: no cover
     pwd_context = None
 
 PASSWORD_REGEX = re.compile(r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[^A-Za-z\d]).{10,128}$")
+# Length bounds implied by PASSWORD_REGEX (`$` also matches before one trailing newline).
+_PASSWORD_MIN_LEN = 10
+_PASSWORD_MAX_LEN = 128 + 1
 
 
 def validate_password_policy(password: str) -> tuple[bool, str]:
-    if not PASSWORD_REGEX.match(password):
+    # Reject out-of-range lengths before the four lookahead scans run.
+    if not _PASSWORD_MIN_LEN <= len(password) <= _PASSWORD_MAX_LEN or not PASSWORD_REGEX.match(password):
         return False, "Password must be 10+ chars with upper, lower, number, and symbol"
     return True, "ok"
 
@@ -41,7 +46,8 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, password_hash: str) -> bool:
     if password_hash.startswith("sha256$"):
-        return password_hash == "sha256$" + hashlib.sha256(password.encode()).hexdigest()
+        expected = "sha256$" + hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(password_hash.encode(), expected.encode())
     if pwd_context:
         try:
             return pwd_context.verify(password, password_hash)
@@ -12,11 +12,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, timedelta
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from core.services.vdot import estimate_vdot
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # ---------------------------------------------------------------------------
 # Weekly summary (preserved from original)
@@ -27,6 +29,8 @@ def weekly_summary(logs_df: pd.DataFrame) -> pd.DataFrame:
 
     Returns a DataFrame with columns: week, duration_min, load_score, sessions.
     """
+    import pandas as pd
+
     if logs_df.empty:
         return pd.DataFrame(columns=["week", "duration_min", "load_score", "sessions"])
     d = logs_df.copy()
@@ -213,31 +217,24 @@ def compute_pace_trends(logs: list[dict]) -> pd.DataFrame:
 
     Returns a DataFrame with columns: date, category, avg_pace, rolling_avg_pace (7-session).
     """
+    import pandas as pd
+
     rows = []
     for log in logs:
         pace = log.get("avg_pace_sec_per_km")
         if pace and float(pace) > 0:
-            rows.append({
-                "date": log["date"],
-                "category": log.get("session_category", "Unknown"),
-                "avg_pace": float(pace),
-                "distance_km": float(log.get("distance_km", 0)),
-            })
+            rows.append((log["date"], log.get("session_category", "Unknown"), float(pace), float(log.get("distance_km", 0))))
     if not rows:
         return pd.DataFrame(columns=["date", "category", "avg_pace", "rolling_avg_pace"])
 
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame.from_records(rows, columns=["date", "category", "avg_pace", "distance_km"])
     df["date"] = pd.to_datetime(df["date"])
-    df = df.sort_values("date")
-
-    # Rolling average per category
-    result_frames = []
-    for cat in df["category"].unique():
-        cat_df = df[df["category"] == cat].copy()
-        cat_df["rolling_avg_pace"] = cat_df["avg_pace"].rolling(window=min(7, len(cat_df)), min_periods=1).mean()
-        result_frames.append(cat_df)
+    df = df.sort_values("date", kind="stable")
 
-    return pd.concat(result_frames).sort_values("date") if result_frames else pd.DataFrame()
+    # Rolling average per category; results align back on the date-sorted index
+    rolling = df.groupby("category", sort=False)["avg_pace"].rolling(window=7, min_periods=1).mean()
+    df["rolling_avg_pace"] = rolling.reset_index(level=0, drop=True)
+    return df
 
 
 # ---------------------------------------------------------------------------
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, true
 from sqlalchemy.orm import Session
 
 from core.db import session_scope
@@ -89,56 +89,54 @@ def collect_athlete_signals(s: Session, athlete_id: int, today: date) -> Athlete
     lookback_14d = today - timedelta(days=13)
     lookback_7d = today - timedelta(days=6)
 
-    latest_checkin = s.execute(
+    # One round trip: the latest check-in plus single-pass conditional
+    # aggregates over training_logs and plan_day_sessions.
+    latest_checkin = (
         select(CheckIn.sleep, CheckIn.energy, CheckIn.recovery, CheckIn.stress)
         .where(CheckIn.athlete_id == athlete_id, CheckIn.day <= today)
         .order_by(CheckIn.day.desc())
-    ).first()
-    readiness = readiness_score(*latest_checkin) if latest_checkin else 3.0
-
-    last_log_date = s.execute(
-        select(func.max(TrainingLog.date)).where(TrainingLog.athlete_id == athlete_id)
-    ).scalar_one_or_none()
-    days_since_log = 999 if not last_log_date else max(0, (today - last_log_date).days)
-
-    pain_recent = bool(
-        s.execute(
-            select(TrainingLog.id).where(
-                TrainingLog.athlete_id == athlete_id,
-                TrainingLog.date >= lookback_7d,
-                TrainingLog.date <= today,
-                TrainingLog.pain_flag.is_(True),
-            )
-        ).first()
+        .limit(1)
+        .subquery()
     )
-
-    next_event_day = s.execute(
-        select(func.min(Event.event_date)).where(Event.athlete_id == athlete_id, Event.event_date >= today)
-    ).scalar_one_or_none()
-    days_to_event = 999 if not next_event_day else max(0, (next_event_day - today).days)
-
-    planned_sessions_14d = s.execute(
-        select(func.count(PlanDaySession.id)).where(
-            PlanDaySession.athlete_id == athlete_id,
-            PlanDaySession.session_day >= lookback_14d,
-            PlanDaySession.session_day <= today,
+    log_stats = (
+        select(
+            func.max(TrainingLog.date).label("last_log_date"),
+            func.count(TrainingLog.id).filter(TrainingLog.date.between(lookback_7d, today), TrainingLog.pain_flag.is_(True)).label("pain_logs_7d"),
+            func.count(TrainingLog.id).filter(TrainingLog.date.between(lookback_14d, today)).label("logged_sessions_14d"),
         )
-    ).scalar_one()
-    completed_sessions_14d = s.execute(
-        select(func.count(PlanDaySession.id)).where(
-            PlanDaySession.athlete_id == athlete_id,
-            PlanDaySession.session_day >= lookback_14d,
-            PlanDaySession.session_day <= today,
-            PlanDaySession.status == "completed",
-        )
-    ).scalar_one()
-    logged_sessions_14d = s.execute(
-        select(func.count(TrainingLog.id)).where(
-            TrainingLog.athlete_id == athlete_id,
-            TrainingLog.date >= lookback_14d,
-            TrainingLog.date <= today,
+        .where(TrainingLog.athlete_id == athlete_id)
+        .subquery()
+    )
+    plan_stats = (
+        select(
+            func.count(PlanDaySession.id).label("planned_sessions_14d"),
+            func.count(PlanDaySession.id).filter(PlanDaySession.status == "completed").label("completed_sessions_14d"),
         )
-    ).scalar_one()
+        .where(PlanDaySession.athlete_id == athlete_id, PlanDaySession.session_day.between(lookback_14d, today))
+        .subquery()
+    )
+    next_event_day = select(func.min(Event.event_date)).where(Event.athlete_id == athlete_id, Event.event_date >= today).scalar_subquery()
+
+    row = s.execute(
+        select(
+            latest_checkin.c.sleep,
+            latest_checkin.c.energy,
+            latest_checkin.c.recovery,
+            latest_checkin.c.stress,
+            log_stats.c.last_log_date,
+            log_stats.c.pain_logs_7d,
+            next_event_day,
+            plan_stats.c.planned_sessions_14d,
+            plan_stats.c.completed_sessions_14d,
+            log_stats.c.logged_sessions_14d,
+        ).select_from(log_stats.join(plan_stats, true()).outerjoin(latest_checkin, true()))
+    ).one()
+    sleep, energy, recovery, stress, last_log_date, pain_logs_7d, next_event_day, planned_sessions_14d, completed_sessions_14d, logged_sessions_14d = row
+
+    readiness = readiness_score(sleep, energy, recovery, stress) if sleep is not None else 3.0
+    days_since_log = 999 if not last_log_date else max(0, (today - last_log_date).days)
+    pain_recent = bool(pain_logs_7d)
+    days_to_event = 999 if not next_event_day else max(0, (next_event_day - today).days)
 
     adherence = derive_adherence(
         int(planned_sessions_14d or 0),
@@ -157,17 +155,11 @@ def collect_athlete_signals(s: Session, athlete_id: int, today: date) -> Athlete
     )
 
 
-def _sync_single_athlete(s: Session, athlete_id: int, today: date) -> dict[str, int]:
+def _sync_single_athlete(s: Session, athlete_id: int, today: date, rows: list[CoachIntervention]) -> dict[str, int]:
     now = datetime.utcnow()
     signals = collect_athlete_signals(s, athlete_id, today)
     rec = compose_recommendation(signals)
 
-    rows = s.execute(
-        select(CoachIntervention).where(
-            CoachIntervention.athlete_id == athlete_id,
-            CoachIntervention.status == "open",
-        )
-    ).scalars().all()
     open_by_action = {row.action_type: row for row in rows}
 
     created = updated = closed = 0
@@ -242,8 +234,16 @@ def sync_interventions_queue(today: date | None = None) -> dict[str, int]:
     summary = {"created": 0, "updated": 0, "closed": 0}
     with session_scope() as s:
         athlete_ids = s.execute(select(Athlete.id).where(Athlete.status == "active")).scalars().all()
+        open_rows = s.execute(
+            select(CoachIntervention)
+            .join(Athlete, Athlete.id == CoachIntervention.athlete_id)
+            .where(Athlete.status == "active", CoachIntervention.status == "open")
+        ).scalars().all()
+        open_by_athlete: dict[int, list[CoachIntervention]] = {}
+        for row in open_rows:
+            open_by_athlete.setdefault(row.athlete_id, []).append(row)
         for athlete_id in athlete_ids:
-            result = _sync_single_athlete(s, int(athlete_id), today)
+            result = _sync_single_athlete(s, int(athlete_id), today, open_by_athlete.get(athlete_id, []))
             summary["created"] += result["created"]
             summary["updated"] += result["updated"]
             summary["closed"] += result["closed"]
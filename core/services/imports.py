@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from io import BytesIO
+
 import pandas as pd
 
 REQUIRED_COLUMNS = ["date", "duration", "distance", "avg_hr", "max_hr", "avg_pace", "session_type"]
@@ -10,6 +12,6 @@ def parse_generic_csv(content: bytes) -> tuple[pd.DataFrame, list[str]]:
 
     Returns (DataFrame, list_of_missing_column_names).
     """
-    df = pd.read_csv(pd.io.common.BytesIO(content))
+    df = pd.read_csv(BytesIO(content))
     errors = [c for c in REQUIRED_COLUMNS if c not in df.columns]
     return df, errors
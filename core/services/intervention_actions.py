@@ -4,27 +4,28 @@ from datetime import datetime, timedelta
 
 from core.models import CoachActionLog, CoachIntervention
 
+# decision -> audit tag appended to why_factors; unknown decisions are dismissals.
+DECISION_TAGS = {
+    "accept_and_close": "accepted",
+    "defer_24h": "defer_24h",
+    "defer_72h": "defer_72h",
+    "modify_action": "modified",
+}
+DEFER_HOURS = {"defer_24h": 24, "defer_72h": 72}
+
 
 def apply_intervention_decision(s, rec: CoachIntervention, decision: str, note: str, modified_action: str | None, actor_user_id: int) -> None:
     note_fragment = note.strip() if note.strip() else "no_note"
-    if decision == "accept_and_close":
-        rec.status = "closed"
-        rec.cooldown_until = None
-        rec.why_factors = list(rec.why_factors or []) + [f"decision:accepted:{note_fragment}"]
-    elif decision == "defer_24h":
-        rec.cooldown_until = datetime.utcnow() + timedelta(hours=24)
-        rec.why_factors = list(rec.why_factors or []) + [f"decision:defer_24h:{note_fragment}"]
-    elif decision == "defer_72h":
-        rec.cooldown_until = datetime.utcnow() + timedelta(hours=72)
-        rec.why_factors = list(rec.why_factors or []) + [f"decision:defer_72h:{note_fragment}"]
-    elif decision == "modify_action":
-        rec.action_type = modified_action or rec.action_type
-        rec.cooldown_until = None
-        rec.why_factors = list(rec.why_factors or []) + [f"decision:modified:{note_fragment}"]
+    defer_hours = DEFER_HOURS.get(decision)
+    if defer_hours:
+        rec.cooldown_until = datetime.utcnow() + timedelta(hours=defer_hours)
     else:
-        rec.status = "closed"
         rec.cooldown_until = None
-        rec.why_factors = list(rec.why_factors or []) + [f"decision:dismissed:{note_fragment}"]
+        if decision == "modify_action":
+            rec.action_type = modified_action or rec.action_type
+        else:
+            rec.status = "closed"
+    rec.why_factors = list(rec.why_factors or []) + [f"decision:{DECISION_TAGS.get(decision, 'dismissed')}:{note_fragment}"]
 
     s.add(
         CoachActionLog(
@@ -20,6 +20,15 @@ ZONE_ORDER = ["Z1", "Z2", "Z3", "Z4", "Z5"]
 
 # Daniels pace hierarchy from easiest to hardest
 DANIELS_PACE_ORDER = ["E", "M", "T", "I", "R"]
+_DANIELS_PACE_INDEX = {pace: idx for idx, pace in enumerate(DANIELS_PACE_ORDER)}
+
+# Base adaptation factors per action, before phase adjustments
+_PHASE_FACTOR_DEFAULTS = {
+    "downshift": {"main_factor": 0.75, "zone_shift": -1, "rep_delta": -1},
+    "taper": {"main_factor": 0.85, "zone_shift": -1, "rep_delta": 0},
+    "progress": {"main_factor": 1.1, "zone_shift": 0, "rep_delta": 1},
+    "keep": {"main_factor": 1.0, "zone_shift": 0, "rep_delta": 0},
+}
 
 
 def compute_acute_chronic_ratio(loads_28d: list[float]) -> float:
@@ -113,9 +122,8 @@ def _shift_zone_label(label: str, delta: int) -> str:
     if not label:
         return label
     updated = label
-    for zone in ZONE_ORDER:
+    for idx, zone in enumerate(ZONE_ORDER):
         if zone in updated:
-            idx = ZONE_ORDER.index(zone)
             nidx = max(0, min(len(ZONE_ORDER) - 1, idx + delta))
             updated = updated.replace(zone, ZONE_ORDER[nidx])
     return updated
@@ -126,9 +134,9 @@ def _shift_daniels_pace(pace: str, delta: int) -> str:
 
     Negative delta = easier (E direction), positive delta = harder (R direction).
     """
-    if pace not in DANIELS_PACE_ORDER:
+    idx = _DANIELS_PACE_INDEX.get(pace)
+    if idx is None:
         return pace
-    idx = DANIELS_PACE_ORDER.index(pace)
     nidx = max(0, min(len(DANIELS_PACE_ORDER) - 1, idx + delta))
     return DANIELS_PACE_ORDER[nidx]
 
@@ -170,14 +178,7 @@ def _determine_phase_factors(action: str, phase: str | None) -> dict:
 
     Returns dict with main_factor, zone_shift, rep_delta adjustments.
     """
-    # Base defaults per action
-    defaults = {
-        "downshift": {"main_factor": 0.75, "zone_shift": -1, "rep_delta": -1},
-        "taper": {"main_factor": 0.85, "zone_shift": -1, "rep_delta": 0},
-        "progress": {"main_factor": 1.1, "zone_shift": 0, "rep_delta": 1},
-        "keep": {"main_factor": 1.0, "zone_shift": 0, "rep_delta": 0},
-    }
-    factors = dict(defaults.get(action, defaults["keep"]))
+    factors = dict(_PHASE_FACTOR_DEFAULTS.get(action, _PHASE_FACTOR_DEFAULTS["keep"]))
 
     if not phase:
         return factors
@@ -218,32 +219,44 @@ def _resolve_pace_labels(session: dict[str, Any], vdot: int) -> dict[str, Any]:
     Adds pace_sec_per_km, pace_display, pace_band_fast, pace_band_slow to each
     target that has a pace_label, and to each interval that has a work_pace.
     """
+    # Labels repeat across blocks and intervals; resolve each one once per call.
+    # Bands are only needed for targets and work paces, so they are cached separately.
+    paces: dict[str, int | None] = {}
+    bands: dict[str, tuple[int, int]] = {}
+
+    def _pace(label: str) -> int | None:
+        if label not in paces:
+            paces[label] = resolve_daniels_pace(label, vdot)
+        return paces[label]
+
+    def _band(label: str) -> tuple[int, int]:
+        if label not in bands:
+            bands[label] = daniels_pace_band(label, vdot)
+        return bands[label]
+
     for block in session.get("blocks", []):
         target = block.get("target")
         if isinstance(target, dict) and "pace_label" in target:
             label = target["pace_label"]
-            sec = resolve_daniels_pace(label, vdot)
+            sec = _pace(label)
             if sec is not None:
-                fast, slow = daniels_pace_band(label, vdot)
                 target["pace_sec_per_km"] = sec
                 target["pace_display"] = pace_display(sec)
-                target["pace_band_fast"] = fast
-                target["pace_band_slow"] = slow
+                target["pace_band_fast"], target["pace_band_slow"] = _band(label)
 
         intervals = block.get("intervals")
         if isinstance(intervals, list):
             for ivl in intervals:
                 wp = ivl.get("work_pace")
                 if wp:
-                    sec = resolve_daniels_pace(wp, vdot)
+                    sec = _pace(wp)
                     if sec is not None:
-                        fast, slow = daniels_pace_band(wp, vdot)
                         ivl["work_pace_sec_per_km"] = sec
                         ivl["work_pace_display"] = pace_display(sec)
-                        ivl["work_pace_band"] = [fast, slow]
+                        ivl["work_pace_band"] = list(_band(wp))
                 rp = ivl.get("recovery_pace")
                 if rp:
-                    sec = resolve_daniels_pace(rp, vdot)
+                    sec = _pace(rp)
                     if sec is not None:
                         ivl["recovery_pace_sec_per_km"] = sec
                         ivl["recovery_pace_display"] = pace_display(sec)
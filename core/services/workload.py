@@ -28,20 +28,30 @@ def queue_snapshot(rows: list[dict[str, Any]], now: datetime) -> QueueSnapshot:
 
     Computes counts (open, high-priority, actionable, snoozed), SLA buckets, and age statistics.
     """
-    ages = [intervention_age_hours(r["created_at"], now) for r in rows if isinstance(r.get("created_at"), datetime)]
-
-    actionable = [r for r in rows if not bool(r.get("is_snoozed"))]
-    due_24h = [r for r in actionable if isinstance(r.get("created_at"), datetime) and intervention_age_hours(r["created_at"], now) >= 24.0]
-    due_72h = [r for r in actionable if isinstance(r.get("created_at"), datetime) and intervention_age_hours(r["created_at"], now) >= 72.0]
+    ages: list[float] = []
+    high_priority = snoozed = due_24h = due_72h = 0
+    for r in rows:
+        if float(r.get("risk") or 0.0) >= 0.75:
+            high_priority += 1
+        is_snoozed = bool(r.get("is_snoozed"))
+        snoozed += is_snoozed
+        created_at = r.get("created_at")
+        if not isinstance(created_at, datetime):
+            continue
+        age = intervention_age_hours(created_at, now)
+        ages.append(age)
+        if not is_snoozed and age >= 24.0:
+            due_24h += 1
+            if age >= 72.0:
+                due_72h += 1
 
     return QueueSnapshot(
         open_count=len(rows),
-        high_priority=len([r for r in rows if float(r.get("risk") or 0.0) >= 0.75]),
-        actionable_now=len(actionable),
-        snoozed=len([r for r in rows if bool(r.get("is_snoozed"))]),
-        sla_due_24h=len(due_24h),
-        sla_due_72h=len(due_72h),
+        high_priority=high_priority,
+        actionable_now=len(rows) - snoozed,
+        snoozed=snoozed,
+        sla_due_24h=due_24h,
+        sla_due_72h=due_72h,
         median_age_hours=round(float(median(ages)) if ages else 0.0, 1),
         oldest_age_hours=max(ages) if ages else 0.0,
     )
-
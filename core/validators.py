@@ -20,7 +20,7 @@ class CheckInInput(BaseModel):
 class TrainingLogInput(BaseModel):
     athlete_id: int = Field(gt=0)
     session_category: str = Field(min_length=1, max_length=80)
-    duration_min: int = Field(ge=0)
+    duration_min: int = Field(ge=0, le=1440)
     distance_km: float = Field(ge=0.0)
     avg_hr: Optional[int] = Field(default=None, ge=30, le=250)
     max_hr: Optional[int] = Field(default=None, ge=30, le=250)
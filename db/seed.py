@@ -11,7 +11,8 @@ from typing import Any
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import select
+from sqlalchemy import exists, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from core.db import session_scope
 from core.models import Athlete, AthletePreference, CheckIn, Event, Plan, PlanDaySession, PlanWeek, SessionLibrary, TrainingLog, User
@@ -160,58 +161,70 @@ def seed_users_athletes() -> None:
                 s.add(plan)
                 s.flush()
                 weeks = generate_plan_weeks(plan.start_date, plan.weeks, plan.race_goal, plan.sessions_per_week, plan.max_session_min)
-                for w in weeks:
-                    week = PlanWeek(plan_id=plan.id, **w)
-                    s.add(week)
-                    s.flush()
-                    assignments = assign_week_sessions(week.week_start, week.sessions_order)
-                    s.add_all(
-                        [
-                            PlanDaySession(
-                                plan_week_id=week.id,
-                                athlete_id=athlete.id,
-                                session_day=a["session_day"],
-                                session_name=a["session_name"],
-                                source_template_name=a["session_name"],
-                                status="planned",
-                            )
-                            for a in assignments
-                        ]
-                    )
+                week_ids = s.scalars(
+                    insert(PlanWeek).returning(PlanWeek.id, sort_by_parameter_order=True),
+                    [{"plan_id": plan.id, **w} for w in weeks],
+                ).all()
+                day_rows = [
+                    {
+                        "plan_week_id": week_id,
+                        "athlete_id": athlete.id,
+                        "session_day": a["session_day"],
+                        "session_name": a["session_name"],
+                        "source_template_name": a["session_name"],
+                        "status": "planned",
+                    }
+                    for week_id, w in zip(week_ids, weeks)
+                    for a in assign_week_sessions(w["week_start"], w["sessions_order"])
+                ]
+                if day_rows:
+                    s.execute(insert(PlanDaySession), day_rows)
 
                 s.add(Event(athlete_id=athlete.id, name=f"Goal {plan.race_goal}", event_date=date.today() + timedelta(days=120), distance=plan.race_goal))
-                for d in range(21):
-                    log_date = date.today() - timedelta(days=d)
-                    s.add(TrainingLog(athlete_id=athlete.id, date=log_date, session_category="Easy Run", duration_min=35 + d % 4 * 5, distance_km=6 + d % 3, rpe=4 + d % 4, load_score=30 + d % 15))
-                    if d % 2 == 0:
-                        s.add(CheckIn(athlete_id=athlete.id, day=log_date, sleep=3 + d % 2, energy=3, recovery=3, stress=2 + d % 2, training_today=True))
+                log_dates = [date.today() - timedelta(days=d) for d in range(21)]
+                s.execute(
+                    insert(TrainingLog),
+                    [
+                        {"athlete_id": athlete.id, "date": log_date, "session_category": "Easy Run", "duration_min": 35 + d % 4 * 5, "distance_km": 6 + d % 3, "rpe": 4 + d % 4, "load_score": 30 + d % 15}
+                        for d, log_date in enumerate(log_dates)
+                    ],
+                )
+                s.execute(
+                    insert(CheckIn),
+                    [
+                        {"athlete_id": athlete.id, "day": log_date, "sleep": 3 + d % 2, "energy": 3, "recovery": 3, "stress": 2 + d % 2, "training_today": True}
+                        for d, log_date in enumerate(log_dates)
+                        if d % 2 == 0
+                    ],
+                )
 
 
 def backfill_plan_day_sessions() -> None:
     with session_scope() as s:
         weeks = s.execute(
-            select(PlanWeek.id, PlanWeek.week_start, PlanWeek.sessions_order, Plan.athlete_id).join(Plan, Plan.id == PlanWeek.plan_id)
-        ).all()
-        for week_id, week_start, sessions_order, athlete_id in weeks:
-            existing = s.execute(select(PlanDaySession.id).where(PlanDaySession.plan_week_id == week_id)).first()
-            if existing:
-                continue
-            if not isinstance(sessions_order, list) or not sessions_order:
-                continue
-            assignments = assign_week_sessions(week_start, sessions_order)
-            s.add_all(
-                [
-                    PlanDaySession(
-                        plan_week_id=week_id,
-                        athlete_id=athlete_id,
-                        session_day=a["session_day"],
-                        session_name=a["session_name"],
-                        source_template_name=a["session_name"],
-                        status="planned",
-                    )
-                    for a in assignments
-                ]
-            )
+            select(PlanWeek.id, PlanWeek.week_start, PlanWeek.sessions_order, Plan.athlete_id)
+            .join(Plan, Plan.id == PlanWeek.plan_id)
+            .where(~exists().where(PlanDaySession.plan_week_id == PlanWeek.id))
+            .execution_options(yield_per=500)
+        )
+        for partition in weeks.partitions():
+            day_rows = [
+                {
+                    "plan_week_id": week_id,
+                    "athlete_id": athlete_id,
+                    "session_day": a["session_day"],
+                    "session_name": a["session_name"],
+                    "source_template_name": a["session_name"],
+                    "status": "planned",
+                }
+                for week_id, week_start, sessions_order, athlete_id in partition
+                if isinstance(sessions_order, list) and sessions_order
+                for a in assign_week_sessions(week_start, sessions_order)
+            ]
+            if day_rows:
+                # An athlete with overlapping plans may already have a session on that day;
+                # keep it rather than failing the batch.
+                s.execute(pg_insert(PlanDaySession).on_conflict_do_nothing(constraint="uq_plan_day_session_athlete_day"), day_rows)
 
 
 def main() -> None:
@@ -0,0 +1,13 @@
+import pytest
+
+from core.config import get_database_url, get_settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    """Settings are cached per process; re-read the (monkeypatched) environment in every test."""
+    get_settings.cache_clear()
+    get_database_url.cache_clear()
+    yield
+    get_settings.cache_clear()
+    get_database_url.cache_clear()
@@ -133,6 +133,17 @@ def test_pace_trends_basic():
     assert "Tempo Run" in categories
 
 
+def test_pace_trends_rolls_within_category():
+    logs = [
+        {"date": date(2026, 1, 3), "session_category": "Easy Run", "avg_pace_sec_per_km": 330, "distance_km": 8},
+        {"date": date(2026, 1, 1), "session_category": "Easy Run", "avg_pace_sec_per_km": 340, "distance_km": 8},
+        {"date": date(2026, 1, 2), "session_category": "Tempo Run", "avg_pace_sec_per_km": 270, "distance_km": 6},
+    ]
+    df = compute_pace_trends(logs)
+    assert list(df["category"]) == ["Easy Run", "Tempo Run", "Easy Run"]
+    assert list(df["rolling_avg_pace"]) == [340.0, 270.0, 335.0]
+
+
 def test_pace_trends_empty():
     df = compute_pace_trends([])
     assert df.empty
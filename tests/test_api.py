@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 
 import pytest
@@ -202,6 +203,17 @@ async def test_dispatch_event_no_subscribers():
     assert count == 0
 
 
+def test_dispatch_event_ignores_cleared_or_unsubscribed_hooks():
+    _webhooks.clear()
+    register_webhook("https://a.com", ["training_log.created"])
+    assert asyncio.run(dispatch_event("checkin.created", {"athlete_id": 1})) == 0
+    hook = register_webhook("https://b.com", ["checkin.created"])
+    unregister_webhook(hook["id"])
+    register_webhook("https://c.com", ["checkin.created"])
+    _webhooks.clear()
+    assert asyncio.run(dispatch_event("checkin.created", {"athlete_id": 1})) == 0
+
+
 def test_valid_events_set():
     assert "checkin.created" in VALID_EVENTS
     assert "training_log.created" in VALID_EVENTS
@@ -238,3 +250,29 @@ def test_openapi_schema_generated():
     assert "/api/v1/auth/token" in schema["paths"]
     assert "info" in schema
     assert schema["info"]["title"] == "Run Season Command API"
+
+
+def test_page_total_skips_count_for_short_pages():
+    from api.routes import _page_total
+
+    class _NoCount:
+        def execute(self, stmt):
+            raise AssertionError("COUNT should not run")
+
+    assert _page_total(_NoCount(), None, offset=0, limit=50, page_len=0) == 0
+    assert _page_total(_NoCount(), None, offset=0, limit=50, page_len=12) == 12
+    assert _page_total(_NoCount(), None, offset=100, limit=50, page_len=7) == 107
+
+
+def test_page_total_counts_full_or_overshot_pages():
+    from api.routes import _page_total
+
+    class _Count:
+        def execute(self, stmt):
+            class _R:
+                def scalar_one(self):
+                    return 321
+            return _R()
+
+    assert _page_total(_Count(), None, offset=0, limit=50, page_len=50) == 321
+    assert _page_total(_Count(), None, offset=400, limit=50, page_len=0) == 321
@@ -0,0 +1,10 @@
+from core import bootstrap
+
+
+def test_ensure_demo_seeded_skips_db_once_seeded(monkeypatch):
+    def _no_db():
+        raise AssertionError("session_scope should not be opened")
+
+    monkeypatch.setattr(bootstrap, "_SEEDED", True)
+    monkeypatch.setattr(bootstrap, "session_scope", _no_db)
+    assert bootstrap.ensure_demo_seeded() is False
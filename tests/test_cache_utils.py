@@ -9,3 +9,42 @@ def test_ttl_cache_expiry():
     assert c.get("k") == 1
     time.sleep(1.1)
     assert c.get("k") is None
+
+
+def test_ttl_cache_expires_on_monotonic_deadline(monkeypatch):
+    from core import cache_utils
+
+    now = [0]
+    monkeypatch.setattr(cache_utils, "monotonic_ns", lambda: now[0])
+    c = TTLCache(ttl_seconds=60)
+    c.set("k", 1)
+    now[0] = 60 * 1_000_000_000
+    assert c.get("k") == 1
+    now[0] += 1
+    assert c.get("k") is None
+
+
+def test_ttl_cache_evicts_least_recently_used_beyond_max_entries():
+    c = TTLCache(ttl_seconds=60, max_entries=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1
+    c.set("c", 3)
+    assert len(c) == 2
+    assert c.get("b") is None
+    assert c.get("a") == 1
+    assert c.get("c") == 3
+
+
+def test_ttl_cache_set_purges_expired_entries(monkeypatch):
+    from core import cache_utils
+
+    now = [0]
+    monkeypatch.setattr(cache_utils, "monotonic_ns", lambda: now[0])
+    c = TTLCache(ttl_seconds=1, max_entries=10)
+    c.set("old", 1)
+    c.set("old", 2)
+    now[0] = 2_000_000_000
+    c.set("new", 3)
+    assert len(c) == 1
+    assert c.get("new") == 3
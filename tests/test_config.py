@@ -23,6 +23,12 @@ def test_settings_frozen():
         pass
 
 
+def test_settings_uses_slots():
+    s = Settings(database_url="x")
+    assert not hasattr(s, "__dict__")
+    assert s.is_dev
+
+
 def test_settings_is_production():
     s = Settings(database_url="x", app_env="production")
     assert s.is_production is True
@@ -47,6 +53,16 @@ def test_get_database_url_default(monkeypatch):
     assert "postgresql" in url
 
 
+def test_get_database_url_reads_loaded_streamlit_secrets(monkeypatch):
+    import sys
+    import types
+
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    fake_st = types.SimpleNamespace(secrets={"DATABASE_URL": "postgres://from-secrets/db"})
+    monkeypatch.setitem(sys.modules, "streamlit", fake_st)
+    assert get_database_url() == "postgres://from-secrets/db"
+
+
 def test_get_settings_uses_env(monkeypatch):
     monkeypatch.setenv("DATABASE_URL", "postgres://test/db")
     monkeypatch.setenv("APP_ENV", "production")
@@ -89,3 +105,31 @@ def test_settings_profile_defaults(monkeypatch):
     # dev profile should set jwt_expire_minutes=1440 and log_level=DEBUG
     assert s.jwt_expire_minutes == 1440
     assert s.log_level == "DEBUG"
+
+
+def test_get_settings_db_pool_overrides(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgres://test/db")
+    monkeypatch.setenv("DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "2")
+    s = get_settings()
+    assert s.db_pool_size == 4
+    assert s.db_max_overflow == 2
+    assert s.db_pool_recycle_seconds == 1800
+
+
+def test_get_settings_is_cached_until_cleared(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgres://test/db")
+    first = get_settings()
+    monkeypatch.setenv("DATABASE_URL", "postgres://other/db")
+    assert get_settings() is first
+    get_settings.cache_clear()
+    get_database_url.cache_clear()
+    assert get_settings().database_url == "postgres://other/db"
+
+
+def test_get_settings_db_pool_pre_ping(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgres://test/db")
+    assert get_settings().db_pool_pre_ping is True
+    get_settings.cache_clear()
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    assert get_settings().db_pool_pre_ping is False
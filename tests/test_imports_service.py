@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pandas as pd
+
 from core.services.imports import REQUIRED_COLUMNS, parse_generic_csv
 
 
@@ -29,3 +31,17 @@ def test_parse_generic_csv_all_columns_present():
     df, errors = parse_generic_csv(content)
     assert errors == []
     assert len(df) == 0
+
+
+def test_parse_generic_csv_blank_cells_are_nan():
+    header = ",".join(REQUIRED_COLUMNS) + "\n"
+    rows = "2026-01-01,45,8.0,140,165,300,Easy Run\n2026-01-02,30,,,,,\n"
+    df, errors = parse_generic_csv((header + rows).encode())
+    assert errors == []
+    assert df["duration"].dtype == "int64"
+    assert df["avg_hr"].dtype == "float64"
+    assert df["session_type"].dtype == object
+    blank = df.iloc[1]
+    assert pd.isna(blank["distance"]) and pd.isna(blank["avg_hr"]) and pd.isna(blank["session_type"])
+    assert blank["avg_hr"] is not pd.NA
+    assert df["distance"].fillna(0.0).astype(float).tolist() == [8.0, 0.0]
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from core.models import CoachActionLog, CoachIntervention
+from core.services.intervention_actions import apply_intervention_decision
+
+
+class _Session:
+    def __init__(self):
+        self.added = []
+
+    def add(self, obj):
+        self.added.append(obj)
+
+
+def _rec():
+    return CoachIntervention(id=7, athlete_id=3, action_type="monitor", status="open", why_factors=["stable"])
+
+
+def test_accept_closes_and_logs():
+    s, rec = _Session(), _rec()
+    apply_intervention_decision(s, rec, "accept_and_close", " done ", None, actor_user_id=1)
+    assert rec.status == "closed"
+    assert rec.cooldown_until is None
+    assert rec.why_factors[-1] == "decision:accepted:done"
+    assert isinstance(s.added[0], CoachActionLog)
+    assert s.added[0].action == "intervention_accept_and_close"
+
+
+def test_defer_sets_cooldown_and_stays_open():
+    rec = _rec()
+    apply_intervention_decision(_Session(), rec, "defer_72h", "", None, actor_user_id=1)
+    assert rec.status == "open"
+    assert rec.cooldown_until > datetime.utcnow()
+    assert rec.why_factors[-1] == "decision:defer_72h:no_note"
+
+
+def test_modify_action_keeps_open():
+    rec = _rec()
+    apply_intervention_decision(_Session(), rec, "modify_action", "", "recovery_week", actor_user_id=1)
+    assert rec.status == "open"
+    assert rec.action_type == "recovery_week"
+    assert rec.why_factors[-1] == "decision:modified:no_note"
+
+
+def test_unknown_decision_dismisses():
+    rec = _rec()
+    apply_intervention_decision(_Session(), rec, "dismiss", "n/a", None, actor_user_id=1)
+    assert rec.status == "closed"
+    assert rec.why_factors[-1] == "decision:dismissed:n/a"
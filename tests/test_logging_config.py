@@ -52,3 +52,49 @@ def test_setup_logging_idempotent():
     setup_logging()
     # Should not add duplicate handlers
     assert len(root.handlers) <= initial_count + 1
+
+
+def test_json_formatter_uses_record_time_and_context():
+    formatter = JSONFormatter()
+    record = logging.LogRecord(
+        name="test", level=logging.INFO, pathname="test.py",
+        lineno=1, msg="hi", args=(), exc_info=None
+    )
+    record.created = 0.0
+    record.ctx_athlete_id = 7
+    parsed = json.loads(formatter.format(record))
+    assert parsed["timestamp"] == "1970-01-01T00:00:00+00:00"
+    assert parsed["context"] == {"ctx_athlete_id": 7}
+
+
+def test_json_formatter_message_with_and_without_args():
+    formatter = JSONFormatter()
+
+    def _fmt(msg, args):
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, msg, args, None)
+        return json.loads(formatter.format(record))["message"]
+
+    assert _fmt("100% done", ()) == "100% done"
+    assert _fmt(ValueError("boom"), None) == "boom"
+    assert _fmt("athlete %s", (7,)) == "athlete 7"
+
+
+def test_setup_logging_writes_json_via_queue_listener(monkeypatch, capsys):
+    from logging.handlers import QueueHandler
+
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    setup_logging("INFO")
+    handler = root.handlers[0]
+    assert isinstance(handler, QueueHandler)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("queued").exception("failed %s", "here")
+    import atexit
+    atexit.unregister(handler.listener.stop)
+    handler.listener.stop()
+    parsed = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert parsed["message"] == "failed here"
+    assert parsed["exception"]["type"] == "ValueError"
@@ -7,3 +7,22 @@ def test_intervention_timestamp_migration_present():
     assert "created_at" in text
     assert "ix_coach_interventions_created_at" in text
 
+
+def test_created_at_defaults_are_utc_wall_clock():
+    # Intervention age/SLA maths subtract created_at from datetime.utcnow(); the
+    # database default must therefore store UTC, not the session's local time.
+    from sqlalchemy.dialects import postgresql
+
+    from core.models import Base
+
+    dialect = postgresql.dialect()
+    tables = [t for t in Base.metadata.sorted_tables if "created_at" in t.c]
+    assert {t.name for t in tables} >= {"athletes", "coach_interventions", "app_write_logs"}
+    for table in tables:
+        default = table.c.created_at.server_default
+        assert default is not None, table.name
+        rendered = str(default.arg.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        assert rendered == "timezone('utc', now())", table.name
+
+    text = Path("alembic/versions/20260211_0014_created_at_utc_defaults.py").read_text()
+    assert "timezone('utc', now())" in text
@@ -20,3 +20,9 @@ def test_verify_legacy_sha256_hash():
     pwd = "StrongPass!123"
     h = "sha256$" + hashlib.sha256(pwd.encode()).hexdigest()
     assert verify_password(pwd, h)
+
+
+def test_verify_legacy_sha256_hash_rejects_wrong_password():
+    h = "sha256$" + hashlib.sha256(b"StrongPass!123").hexdigest()
+    assert not verify_password("StrongPass!124", h)
+    assert not verify_password("StrongPass!123", h + "\u00e9")
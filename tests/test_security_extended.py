@@ -39,6 +39,12 @@ def test_validate_password_policy_no_symbol():
     assert ok is False
 
 
+def test_validate_password_policy_length_bounds():
+    assert validate_password_policy("Aa1!" + "x" * 124)[0] is True
+    assert validate_password_policy("Aa1!" + "x" * 125)[0] is False
+    assert validate_password_policy("Aa1!" + "x" * 100_000)[0] is False
+
+
 def test_hash_and_verify_roundtrip():
     password = "TestPassword!123"
     hashed = hash_password(password)
@@ -84,6 +84,14 @@ def test_training_log_negative_distance():
         )
 
 
+def test_training_log_duration_over_a_day():
+    with pytest.raises(ValidationError):
+        TrainingLogInput(
+            athlete_id=1, session_category="Run", duration_min=1441,
+            distance_km=5.0, rpe=5
+        )
+
+
 # --- PlanCreateInput ---
 
 def test_plan_create_valid():